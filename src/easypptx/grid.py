@@ -1,18 +1,167 @@
 """Grid layout module for EasyPPTX."""
 
 from collections.abc import Callable
+from functools import lru_cache
+from math import isqrt
 from typing import Any, overload
 
+import numpy as np
+
 from easypptx.slide import PositionType
 
 # Using forward annotations (PEP 563) to avoid circular references
 
 
+def _parse_pct(value: str) -> float:
+    """Parse a percentage string such as "12.34%" into a float.
+
+    Args:
+        value: Percentage string, with or without a trailing "%"
+
+    Returns:
+        The numeric percentage
+    """
+    return float(value[:-1]) if value.endswith("%") else float(value)
+
+
+def _as_pct(value: PositionType, slide_dim_inches: float) -> float:
+    """Convert a position or size value to a percentage of the slide dimension.
+
+    Args:
+        value: Percentage string (e.g. "25%") or absolute value in inches
+        slide_dim_inches: The matching slide dimension in inches
+
+    Returns:
+        The value as a float percentage
+    """
+    if isinstance(value, str) and value.endswith("%"):
+        return _parse_pct(value)
+    return float(value) / slide_dim_inches * 100
+
+
+def _ignore_position(func: Callable) -> Callable:
+    """Wrap a content function so that it is called without position arguments.
+
+    Args:
+        func: Content function that takes no arguments
+
+    Returns:
+        A function accepting (and ignoring) any keyword arguments
+    """
+    return lambda **kwargs: func()
+
+
+@lru_cache(maxsize=128)
+def _grid_geometry(
+    rows: int, cols: int, padding: float
+) -> tuple[
+    tuple[tuple[float, ...], tuple[float, ...], float, float],
+    tuple[tuple[str, ...], tuple[str, ...], str, str],
+]:
+    """Compute the grid-relative cell geometry for a grid layout.
+
+    The result depends only on the grid dimensions and padding, so it is cached
+    and shared between all grids with the same layout.
+
+    Args:
+        rows: Number of rows
+        cols: Number of columns
+        padding: Padding between cells as percentage of cell size
+
+    Returns:
+        A pair of tuples. The first holds the column x offsets, row y offsets,
+        cell width and cell height as floats; the second holds the same values
+        formatted as percentage strings.
+    """
+    # Convert percentage values to floats for calculations
+    padding_factor = padding / 100.0
+
+    # Calculate the width and height of each cell including padding
+    cell_width_percent = 100.0 / cols
+    cell_height_percent = 100.0 / rows
+
+    # Calculate the effective width and height of each cell (excluding padding)
+    effective_cell_width = cell_width_percent * (1 - padding_factor)
+    effective_cell_height = cell_height_percent * (1 - padding_factor)
+
+    # Half of the padding (as percentage of total grid size)
+    half_padding_width = (cell_width_percent * padding_factor) / 2
+    half_padding_height = (cell_height_percent * padding_factor) / 2
+
+    # Every cell position is an affine function of its row/column index, so
+    # compute all of them at once and format each distinct value only once
+    x_vals = tuple((np.arange(cols) * cell_width_percent + half_padding_width).tolist())
+    y_vals = tuple((np.arange(rows) * cell_height_percent + half_padding_height).tolist())
+    x_strs = tuple(f"{v:.2f}%" for v in x_vals)
+    y_strs = tuple(f"{v:.2f}%" for v in y_vals)
+
+    return (
+        (x_vals, y_vals, effective_cell_width, effective_cell_height),
+        (x_strs, y_strs, f"{effective_cell_width:.2f}%", f"{effective_cell_height:.2f}%"),
+    )
+
+
+@lru_cache(maxsize=256)
+def _absolute_geometry(
+    x: float, y: float, width: float, height: float, rows: int, cols: int, padding: float
+) -> tuple[tuple[str, ...], tuple[str, ...], str, str]:
+    """Compute the slide-relative cell positions for a fully specified grid.
+
+    Decks often repeat the same grid layout on many slides, so the formatted
+    positions are cached and reused instead of being recomputed per cell.
+
+    Args:
+        x: X position of the grid as percentage of the slide
+        y: Y position of the grid as percentage of the slide
+        width: Width of the grid as percentage of the slide
+        height: Height of the grid as percentage of the slide
+        rows: Number of rows
+        cols: Number of columns
+        padding: Padding between cells as percentage of cell size
+
+    Returns:
+        Tuple of (column x strings, row y strings, cell width string, cell height string)
+        as percentage strings of the slide
+    """
+    (x_vals, y_vals, cell_width, cell_height), _ = _grid_geometry(rows, cols, padding)
+
+    x_strs = tuple(f"{x + (v * width / 100):.2f}%" for v in x_vals)
+    y_strs = tuple(f"{y + (v * height / 100):.2f}%" for v in y_vals)
+
+    return x_strs, y_strs, f"{cell_width * width / 100:.2f}%", f"{cell_height * height / 100:.2f}%"
+
+
+def _scan_and_mark(spanned: np.ndarray, start_row: int, start_col: int, end_row: int, end_col: int) -> bool:
+    """Check a merge region for spanned cells and mark it if it is free.
+
+    Args:
+        spanned: Boolean array of spanned flags for the grid
+        start_row: Starting row index (inclusive)
+        start_col: Starting column index (inclusive)
+        end_row: Ending row index (inclusive)
+        end_col: Ending column index (inclusive)
+
+    Returns:
+        True if any cell in the region is already spanned (nothing is marked),
+        False if the region was free and has been marked
+    """
+    region = spanned[start_row : end_row + 1, start_col : end_col + 1]
+    if region.any():
+        return True
+
+    # Every cell except the top-left one becomes part of the merged span
+    region[...] = True
+    region[0, 0] = False
+    return False
+
+
 class GridCell:
     """Class representing a cell in a grid.
 
     This class stores information about a cell's position and dimensions
-    within a grid layout.
+    within a grid layout. Grid placement reads the numeric x_pct, y_pct,
+    width_pct and height_pct fields; the string fields are rounded display
+    values, so changing only them does not move content placed in the cell.
 
     Attributes:
         row: Row index
@@ -21,10 +170,26 @@ class GridCell:
         y: Y position as percentage
         width: Width as percentage
         height: Height as percentage
+        x_pct: X position as a float percentage
+        y_pct: Y position as a float percentage
+        width_pct: Width as a float percentage
+        height_pct: Height as a float percentage
         content: The content placed in this cell (if any)
     """
 
-    def __init__(self, row: int, col: int, x: str, y: str, width: str, height: str) -> None:
+    def __init__(
+        self,
+        row: int,
+        col: int,
+        x: str,
+        y: str,
+        width: str,
+        height: str,
+        x_pct: float | None = None,
+        y_pct: float | None = None,
+        width_pct: float | None = None,
+        height_pct: float | None = None,
+    ) -> None:
         """Initialize a GridCell.
 
         Args:
@@ -34,6 +199,10 @@ class GridCell:
             y: Y position as percentage
             width: Width as percentage
             height: Height as percentage
+            x_pct: Numeric X position (default: parsed from x)
+            y_pct: Numeric Y position (default: parsed from y)
+            width_pct: Numeric width (default: parsed from width)
+            height_pct: Numeric height (default: parsed from height)
         """
         self.row = row
         self.col = col
@@ -41,6 +210,11 @@ class GridCell:
         self.y = y
         self.width = width
         self.height = height
+        # Keep numeric copies so layout math does not re-parse the strings
+        self.x_pct = _parse_pct(x) if x_pct is None else x_pct
+        self.y_pct = _parse_pct(y) if y_pct is None else y_pct
+        self.width_pct = _parse_pct(width) if width_pct is None else width_pct
+        self.height_pct = _parse_pct(height) if height_pct is None else height_pct
         self.content: Any = None
         self.span_rows = 1
         self.span_cols = 1
@@ -165,7 +339,7 @@ class Grid:
         rows: Number of rows in the grid
         cols: Number of columns in the grid
         padding: Padding between cells as percentage of cell size
-        cells: 2D array of GridCell objects
+        cells: Read-only rows of GridCell objects, indexed as cells[row][col]
 
     Examples:
         ```python
@@ -246,8 +420,24 @@ class Grid:
         self._slide_width = self._get_slide_width()
         self._slide_height = self._get_slide_height()
 
+        # Cache the grid's own position and size as float percentages of the slide
+        slide_width_inches = self._slide_width / 914400  # Convert EMUs to inches
+        slide_height_inches = self._slide_height / 914400
+        self._x_pct = _as_pct(x, slide_width_inches)
+        self._y_pct = _as_pct(y, slide_height_inches)
+        self._w_pct = _as_pct(width, slide_width_inches)
+        self._h_pct = _as_pct(height, slide_height_inches)
+
         # Calculate cell dimensions
-        self.cells = self._create_cells()
+        self._create_cells()
+
+    @property
+    def cells(self) -> list["GridRowView"]:
+        """Read-only rows of GridCell objects, indexed as cells[row][col].
+
+        Each row is a lightweight view, so cells are only built when accessed.
+        """
+        return [GridRowView(self, row) for row in range(self.rows)]
 
     def _get_slide_width(self) -> int:
         """Get the slide width in EMUs from the parent.
@@ -326,50 +516,68 @@ class Grid:
 
         return result
 
-    def _create_cells(self) -> list[list[GridCell]]:
-        """Create the grid cells based on the layout.
+    def _create_cells(self) -> None:
+        """Compute the grid cell geometry based on the layout.
 
-        Returns:
-            2D array of GridCell objects
+        The cell geometry and span state are stored as parallel NumPy arrays
+        (``_x``, ``_y``, ``_w``, ``_h``, ``_spanned``, ``_span_rows``, ``_span_cols``)
+        so that range checks and bulk updates are single slice operations.
+        GridCell objects are only built when a cell is accessed, see get_cell.
         """
-        cells = []
-
-        # Convert percentage values to floats for calculations
-        padding_factor = self.padding / 100.0
-
-        # Calculate the width and height of each cell including padding
-        cell_width_percent = 100.0 / self.cols
-        cell_height_percent = 100.0 / self.rows
-
-        # Calculate the effective width and height of each cell (excluding padding)
-        effective_cell_width = cell_width_percent * (1 - padding_factor)
-        effective_cell_height = cell_height_percent * (1 - padding_factor)
-
-        # Half of the padding (as percentage of total grid size)
-        half_padding_width = (cell_width_percent * padding_factor) / 2
-        half_padding_height = (cell_height_percent * padding_factor) / 2
-
-        # Create cells
-        for row in range(self.rows):
-            cell_row = []
-            for col in range(self.cols):
-                # Calculate cell position
-                x_percent = (col * cell_width_percent) + half_padding_width
-                y_percent = (row * cell_height_percent) + half_padding_height
-
-                # Convert to percentage strings
-                x_str = f"{x_percent:.2f}%"
-                y_str = f"{y_percent:.2f}%"
-                width_str = f"{effective_cell_width:.2f}%"
-                height_str = f"{effective_cell_height:.2f}%"
-
-                # Create the cell
-                cell = GridCell(row, col, x_str, y_str, width_str, height_str)
-                cell_row.append(cell)
+        (x_vals, y_vals, cell_width, cell_height), (x_strs, y_strs, width_str, height_str) = _grid_geometry(
+            self.rows, self.cols, self.padding
+        )
+        self._x_strs = x_strs
+        self._y_strs = y_strs
+        self._width_str = width_str
+        self._height_str = height_str
+
+        # Store the geometry and span state as parallel arrays
+        shape = (self.rows, self.cols)
+        self._x = np.broadcast_to(np.array(x_vals), shape).copy()
+        self._y = np.broadcast_to(np.array(y_vals)[:, np.newaxis], shape).copy()
+        self._w = np.full(shape, cell_width)
+        self._h = np.full(shape, cell_height)
+        self._spanned = np.zeros(shape, dtype=bool)
+        self._span_rows = np.ones(shape, dtype=int)
+        self._span_cols = np.ones(shape, dtype=int)
+
+        # GridCell objects built so far, keyed by (row, col)
+        self._cell_cache: dict[tuple[int, int], GridCell] = {}
+
+    def _build_cell(self, row: int, col: int) -> GridCell:
+        """Build a GridCell from the geometry arrays.
 
-            cells.append(cell_row)
+        Args:
+            row: Row index (0-based)
+            col: Column index (0-based)
 
-        return cells
+        Returns:
+            A new GridCell for the given position
+        """
+        span_rows = int(self._span_rows[row, col])
+        span_cols = int(self._span_cols[row, col])
+        width = float(self._w[row, col])
+        height = float(self._h[row, col])
+
+        # Only merged cells differ from the shared cell size
+        merged = span_rows > 1 or span_cols > 1
+        cell = GridCell(
+            row,
+            col,
+            self._x_strs[col],
+            self._y_strs[row],
+            f"{width:.2f}%" if merged else self._width_str,
+            f"{height:.2f}%" if merged else self._height_str,
+            x_pct=float(self._x[row, col]),
+            y_pct=float(self._y[row, col]),
+            width_pct=width,
+            height_pct=height,
+        )
+        cell.span_rows = span_rows
+        cell.span_cols = span_cols
+        cell.is_spanned = bool(self._spanned[row, col])
+        return cell
 
     def get_cell(self, row: int, col: int) -> GridCell:
         """Get a cell at the specified row and column.
@@ -387,7 +595,10 @@ class Grid:
         if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
             raise OutOfBoundsError(f"Cell position ({row}, {col}) is out of bounds")
 
-        return self.cells[row][col]
+        cell = self._cell_cache.get((row, col))
+        if cell is None:
+            cell = self._cell_cache[row, col] = self._build_cell(row, col)
+        return cell
 
     def merge_cells(self, start_row: int, start_col: int, end_row: int, end_col: int) -> GridCell:
         """Merge cells in the specified range.
@@ -422,47 +633,74 @@ class Grid:
         if start_row > end_row or start_col > end_col:
             raise CellMergeError("Start coordinates must be less than or equal to end coordinates")
 
-        # Check if any of the cells in the range are already merged
-        for row in range(start_row, end_row + 1):
-            for col in range(start_col, end_col + 1):
-                cell = self.cells[row][col]
-                if cell.is_spanned:
-                    raise CellMergeError("Cell is already part of a merged cell")
-
-        # Get the first cell (top-left)
-        first_cell = self.cells[start_row][start_col]
-
-        # Calculate the new width and height
-        last_cell = self.cells[end_row][end_col]
+        # Check that none of the cells in the range are already merged, and mark them as spanned
+        if _scan_and_mark(self._spanned, start_row, start_col, end_row, end_col):
+            raise CellMergeError("Cell is already part of a merged cell")
 
-        # Extract numeric values from percentage strings
-        first_x = float(first_cell.x.strip("%"))
-        first_y = float(first_cell.y.strip("%"))
-
-        # Calculate the rightmost and bottommost positions
-        last_x = float(last_cell.x.strip("%"))
-        last_y = float(last_cell.y.strip("%"))
-        last_width = float(last_cell.width.strip("%"))
-        last_height = float(last_cell.height.strip("%"))
-
-        # Calculate the new width and height
-        new_width = (last_x + last_width) - first_x
-        new_height = (last_y + last_height) - first_y
+        # Calculate the new width and height from the rightmost and bottommost edges
+        new_width = float(self._x[end_row, end_col] + self._w[end_row, end_col] - self._x[start_row, start_col])
+        new_height = float(self._y[end_row, end_col] + self._h[end_row, end_col] - self._y[start_row, start_col])
+        span_rows = end_row - start_row + 1
+        span_cols = end_col - start_col + 1
 
         # Update the first cell's dimensions
+        self._w[start_row, start_col] = new_width
+        self._h[start_row, start_col] = new_height
+        self._span_rows[start_row, start_col] = span_rows
+        self._span_cols[start_row, start_col] = span_cols
+
+        # Keep the GridCell objects built so far in sync with the arrays
+        for (row, col), cell in self._cell_cache.items():
+            if start_row <= row <= end_row and start_col <= col <= end_col:
+                cell.is_spanned = True
+
+        first_cell = self.get_cell(start_row, start_col)
+        first_cell.is_spanned = False
+        first_cell.width_pct = new_width
+        first_cell.height_pct = new_height
         first_cell.width = f"{new_width:.2f}%"
         first_cell.height = f"{new_height:.2f}%"
-        first_cell.span_rows = end_row - start_row + 1
-        first_cell.span_cols = end_col - start_col + 1
-
-        # Mark other cells in the range as spanned
-        for row in range(start_row, end_row + 1):
-            for col in range(start_col, end_col + 1):
-                if row != start_row or col != start_col:
-                    self.cells[row][col].is_spanned = True
+        first_cell.span_rows = span_rows
+        first_cell.span_cols = span_cols
 
         return first_cell
 
+    def _cell_to_absolute(self, cell: GridCell) -> tuple[str, str, str, str]:
+        """Convert a cell's grid-relative geometry to slide-relative percentages.
+
+        Args:
+            cell: The GridCell to convert
+
+        Returns:
+            Tuple of (x, y, width, height) as percentage strings of the slide
+        """
+        if cell.span_rows == 1 and cell.span_cols == 1:
+            # Unmerged cells share the cached table for this grid layout, unless their
+            # geometry was changed after the cell was built
+            (x_vals, y_vals, cell_width, cell_height), _ = _grid_geometry(self.rows, self.cols, self.padding)
+            if (
+                cell.x_pct == x_vals[cell.col]
+                and cell.y_pct == y_vals[cell.row]
+                and cell.width_pct == cell_width
+                and cell.height_pct == cell_height
+            ):
+                x_strs, y_strs, width_str, height_str = _absolute_geometry(
+                    self._x_pct, self._y_pct, self._w_pct, self._h_pct, self.rows, self.cols, self.padding
+                )
+                return x_strs[cell.col], y_strs[cell.row], width_str, height_str
+
+        abs_x_percent = self._x_pct + (cell.x_pct * self._w_pct / 100)
+        abs_y_percent = self._y_pct + (cell.y_pct * self._h_pct / 100)
+        abs_width_percent = cell.width_pct * self._w_pct / 100
+        abs_height_percent = cell.height_pct * self._h_pct / 100
+
+        return (
+            f"{abs_x_percent:.2f}%",
+            f"{abs_y_percent:.2f}%",
+            f"{abs_width_percent:.2f}%",
+            f"{abs_height_percent:.2f}%",
+        )
+
     def add_to_cell(self, row: int, col: int, content_func: Callable, **kwargs) -> Any:
         """Add content to a specific cell in the grid.
 
@@ -483,52 +721,11 @@ class Grid:
         cell = self.get_cell(row, col)
 
         # Check if the cell is part of a merged cell
-        if cell.is_spanned:
+        if self._spanned[row, col]:
             raise CellMergeError("Cell is part of a merged cell")
 
         # Calculate the absolute position based on the grid's position
-        # Convert grid position percentage to float
-        if isinstance(self.x, str) and self.x.endswith("%"):
-            grid_x_percent = float(self.x.strip("%"))
-        else:
-            # Convert inches to percentage based on actual slide width
-            slide_width_inches = self._slide_width / 914400  # Convert EMUs to inches
-            grid_x_percent = (float(self.x) / slide_width_inches) * 100
-
-        if isinstance(self.y, str) and self.y.endswith("%"):
-            grid_y_percent = float(self.y.strip("%"))
-        else:
-            # Convert inches to percentage based on actual slide height
-            slide_height_inches = self._slide_height / 914400  # Convert EMUs to inches
-            grid_y_percent = (float(self.y) / slide_height_inches) * 100
-
-        # Calculate absolute position
-        cell_x_percent = float(cell.x.strip("%"))
-        cell_y_percent = float(cell.y.strip("%"))
-
-        # Handle the width/height values to correctly handle both string and float types
-        width_value = (
-            float(self.width.strip("%")) if isinstance(self.width, str) and "%" in self.width else float(self.width)
-        )
-        height_value = (
-            float(self.height.strip("%")) if isinstance(self.height, str) and "%" in self.height else float(self.height)
-        )
-
-        abs_x_percent = grid_x_percent + (cell_x_percent * width_value / 100)
-        abs_y_percent = grid_y_percent + (cell_y_percent * height_value / 100)
-
-        # Calculate absolute width and height
-        cell_width_percent = float(cell.width.strip("%"))
-        cell_height_percent = float(cell.height.strip("%"))
-
-        abs_width_percent = cell_width_percent * width_value / 100
-        abs_height_percent = cell_height_percent * height_value / 100
-
-        # Format as percentage strings
-        kwargs["x"] = f"{abs_x_percent:.2f}%"
-        kwargs["y"] = f"{abs_y_percent:.2f}%"
-        kwargs["width"] = f"{abs_width_percent:.2f}%"
-        kwargs["height"] = f"{abs_height_percent:.2f}%"
+        kwargs["x"], kwargs["y"], kwargs["width"], kwargs["height"] = self._cell_to_absolute(cell)
 
         # We previously were going to set word_wrap, but slide.add_text doesn't accept this parameter
         # The word_wrap flag is now set internally in the add_text method
@@ -541,6 +738,42 @@ class Grid:
 
         return content
 
+    def add_to_cells_bulk(self, items: list[tuple[int, int, Callable, dict[str, Any]]]) -> list[Any]:
+        """Add content to several cells in the grid at once.
+
+        This is equivalent to calling add_to_cell for each item, and lets callers
+        such as autogrid place all of their content in a single call.
+
+        Args:
+            items: List of (row, col, content_func, kwargs) tuples, where kwargs are
+                   additional arguments to pass to the content function
+
+        Returns:
+            List of the objects returned by the content functions, in item order
+
+        Raises:
+            OutOfBoundsError: If a row or column is out of bounds
+            CellMergeError: If a cell is part of a merged cell
+        """
+        results = []
+        for row, col, content_func, kwargs in items:
+            cell = self.get_cell(row, col)
+
+            # Check if the cell is part of a merged cell
+            if self._spanned[row, col]:
+                raise CellMergeError("Cell is part of a merged cell")
+
+            # Calculate the absolute position based on the grid's position
+            kwargs = dict(kwargs)
+            kwargs["x"], kwargs["y"], kwargs["width"], kwargs["height"] = self._cell_to_absolute(cell)
+
+            # Call the content function and store the content in the cell
+            content = content_func(**kwargs)
+            cell.content = content
+            results.append(content)
+
+        return results
+
     def add_grid_to_cell(
         self,
         row: int,
@@ -571,7 +804,7 @@ class Grid:
         cell = self.get_cell(row, col)
 
         # Check if the cell is part of a merged cell
-        if cell.is_spanned:
+        if self._spanned[row, col]:
             raise CellMergeError("Cell is part of a merged cell")
 
         # Merge provided kwargs with template defaults
@@ -579,49 +812,15 @@ class Grid:
         merged_kwargs = self.merge_with_defaults("grid", kwargs)
 
         # Calculate absolute position for the nested grid
-        if isinstance(self.x, str) and self.x.endswith("%"):
-            grid_x_percent = float(self.x.strip("%"))
-        else:
-            # Convert inches to percentage based on actual slide width
-            slide_width_inches = self._slide_width / 914400  # Convert EMUs to inches
-            grid_x_percent = (float(self.x) / slide_width_inches) * 100
-
-        if isinstance(self.y, str) and self.y.endswith("%"):
-            grid_y_percent = float(self.y.strip("%"))
-        else:
-            # Convert inches to percentage based on actual slide height
-            slide_height_inches = self._slide_height / 914400  # Convert EMUs to inches
-            grid_y_percent = (float(self.y) / slide_height_inches) * 100
-
-        # Calculate absolute position
-        cell_x_percent = float(cell.x.strip("%"))
-        cell_y_percent = float(cell.y.strip("%"))
-
-        # Handle the width/height values to correctly handle both string and float types
-        width_value = (
-            float(self.width.strip("%")) if isinstance(self.width, str) and "%" in self.width else float(self.width)
-        )
-        height_value = (
-            float(self.height.strip("%")) if isinstance(self.height, str) and "%" in self.height else float(self.height)
-        )
-
-        abs_x_percent = grid_x_percent + (cell_x_percent * width_value / 100)
-        abs_y_percent = grid_y_percent + (cell_y_percent * height_value / 100)
-
-        # Calculate absolute width and height
-        cell_width_percent = float(cell.width.strip("%"))
-        cell_height_percent = float(cell.height.strip("%"))
-
-        abs_width_percent = cell_width_percent * width_value / 100
-        abs_height_percent = cell_height_percent * height_value / 100
+        abs_x, abs_y, abs_width, abs_height = self._cell_to_absolute(cell)
 
         # Create the nested grid
         nested_grid = Grid(
             parent=self.parent,
-            x=f"{abs_x_percent:.2f}%",
-            y=f"{abs_y_percent:.2f}%",
-            width=f"{abs_width_percent:.2f}%",
-            height=f"{abs_height_percent:.2f}%",
+            x=abs_x,
+            y=abs_y,
+            width=abs_width,
+            height=abs_height,
             rows=merged_kwargs.get("rows", 1),
             cols=merged_kwargs.get("cols", 1),
             padding=merged_kwargs.get("padding", 5.0),
@@ -646,7 +845,7 @@ class Grid:
         """
         for row in range(self.rows):
             for col in range(self.cols):
-                yield self.cells[row][col]
+                yield self.get_cell(row, col)
 
     @overload
     def __getitem__(self, key: int) -> GridCellProxy: ...
@@ -977,32 +1176,25 @@ class Grid:
         """
         # Calculate current grid capacity and total items
         capacity = self.rows * self.cols
-        cells_used = 0
-
-        # Count used cells
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.cells[row][col].content is not None:
-                    cells_used += 1
+        cells_used = sum(cell.content is not None for cell in self._cell_cache.values())
 
         # If grid is full, add a new row
         if cells_used >= capacity:
             self._expand_grid(add_rows=1, add_cols=0)
 
-        # Find the next available cell
+        # Find the next available cell (cells that were never built have no content)
         target_cell = None
         for row in range(self.rows):
             for col in range(self.cols):
-                if self.cells[row][col].content is None:
-                    target_cell = self.cells[row][col]
+                cell = self._cell_cache.get((row, col))
+                if cell is None or cell.content is None:
+                    target_cell = self.get_cell(row, col)
                     break
             if target_cell:
                 break
 
         # Add content to the target cell
         if target_cell:
-            row, col = target_cell.row, target_cell.col
-
             # Calculate position and dimensions for content
             x = target_cell.x
             y = target_cell.y
@@ -1031,25 +1223,18 @@ class Grid:
         if add_rows <= 0 and add_cols <= 0:
             return  # Nothing to do
 
-        # Save original dimensions
-        original_rows = self.rows
-        original_cols = self.cols
-
         # Update dimensions
         self.rows += add_rows
         self.cols += add_cols
 
         # Recalculate cell dimensions
-        new_cells = self._create_cells()
+        old_cells = self._cell_cache
+        self._create_cells()
 
         # Copy content from old cells to new cells where applicable
-        for row in range(original_rows):
-            for col in range(original_cols):
-                if row < self.rows and col < self.cols:
-                    new_cells[row][col].content = self.cells[row][col].content
-
-        # Update cells
-        self.cells = new_cells
+        for (row, col), cell in old_cells.items():
+            if cell.content is not None and row < self.rows and col < self.cols:
+                self.get_cell(row, col).content = cell.content
 
     @classmethod
     def autogrid(
@@ -1103,29 +1288,30 @@ class Grid:
 
         if rows is None and cols is None:
             # Determine optimal grid dimensions
-            cols = max(1, int(num_items**0.5))
-            rows = (num_items + cols - 1) // cols
+            cols = max(1, isqrt(num_items))
+            rows = -(-num_items // cols)
         elif rows is None:
             rows = (num_items + cols - 1) // cols
         elif cols is None:
             cols = (num_items + rows - 1) // rows
 
         # Adjust grid position and dimensions if a title is provided
+        title_y = y
         adjusted_y = y
         adjusted_height = height
 
         if title and isinstance(y, str) and y.endswith("%"):
-            y_percent = float(y.strip("%"))
-            title_height_percent = float(str(title_height).strip("%"))
-            # Adjust y position and height for the grid
-            adjusted_y = f"{y_percent:.2f}%"
-            title_y = adjusted_y
-            adjusted_y = f"{(y_percent + title_height_percent):.2f}%"
+            # Keep the offsets as floats and only format the values handed to the grid
+            y_percent = _parse_pct(y)
+            title_height_percent = _parse_pct(str(title_height))
+
+            # Shift the grid below the title
+            adjusted_y = f"{y_percent + title_height_percent:.2f}%"
 
             # Adjust height to account for title
             if isinstance(height, str) and height.endswith("%"):
-                height_percent = float(height.strip("%"))
-                adjusted_height = f"{(height_percent - title_height_percent):.2f}%"
+                height_percent = _parse_pct(height)
+                adjusted_height = f"{height_percent - title_height_percent:.2f}%"
 
         # Create the grid
         grid = cls(
@@ -1157,24 +1343,11 @@ class Grid:
         # when users specify (rows, cols)
         col_idx = 0
         row_idx = 0
+        items: list[tuple[int, int, Callable, dict[str, Any]]] = []
 
         for func in content_funcs:
-            # Create a wrapper function factory to properly capture the current func
-            def create_wrapper(content_func):
-                def position_agnostic_wrapper(**kwargs):
-                    return content_func()
-
-                return position_agnostic_wrapper
-
-            # Create a wrapper specifically for this function
-            wrapper = create_wrapper(func)
-
-            # Add content to the current cell using the wrapper
-            grid.add_to_cell(
-                row=row_idx,
-                col=col_idx,
-                content_func=wrapper,
-            )
+            # Queue content for the current cell, dropping the position arguments
+            items.append((row_idx, col_idx, _ignore_position(func), {}))
 
             # Move to next cell (column-major order: increment row first, then column)
             row_idx += 1
@@ -1186,6 +1359,9 @@ class Grid:
             if col_idx >= cols:
                 break
 
+        # Add all content in one pass
+        grid.add_to_cells_bulk(items)
+
         return grid
 
     @classmethod
@@ -1206,6 +1382,7 @@ class Grid:
         dpi: int = 300,
         file_format: str = "png",
         column_major: bool = True,  # Use column-major order by default
+        parallel: bool = False,
         **kwargs,  # Accept any additional parameters
     ) -> "Grid":
         """Create a grid and automatically place matplotlib figures into cells.
@@ -1232,33 +1409,58 @@ class Grid:
                          When True, fills cells down columns first, resulting in a visual layout
                          that matches the specified rows and columns when content is added sequentially.
                          When False, fills cells across rows first.
+            parallel: Whether to render the figures concurrently in a thread pool (default: False)
+                      Matplotlib is not thread-safe, so only enable this for figures that are not
+                      used from other threads. Only the image encoding step can run concurrently.
+                      A figure that appears more than once is rendered only once.
             **kwargs: Additional parameters (ignored)
 
         Returns:
             The created Grid object
         """
+        import io
         import os
-        import tempfile
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Create content functions from matplotlib figures
-        content_funcs = []
+        # Materialize the figures, since they are walked and indexed several times below
+        figures = list(figures)
 
-        # Save each figure to a temporary file and create content functions
-        temp_files = []
-        for fig in figures:
-            # Create a temporary file using context manager
-            with tempfile.NamedTemporaryFile(suffix=f".{file_format}", delete=False) as temp_file:
-                temp_path = temp_file.name
-                temp_files.append(temp_path)
+        # Render each figure into its own in-memory buffer
+        buffers = [io.BytesIO() for _ in figures]
 
-            # Save the figure to the temporary file
-            fig.savefig(temp_path, dpi=dpi, format=file_format, bbox_inches="tight")
+        # Render each distinct figure only once, so no figure is saved from two threads at a time
+        first_index: dict[int, int] = {}
+        for index, fig in enumerate(figures):
+            first_index.setdefault(id(fig), index)
+        unique_indices = list(first_index.values())
 
+        def save_figure(index: int) -> None:
+            figures[index].savefig(buffers[index], dpi=dpi, format=file_format, bbox_inches="tight")
+            buffers[index].seek(0)
+
+        if parallel and len(unique_indices) > 1:
+            # Drawing holds the GIL, but image encoding releases it and can overlap
+            max_workers = min(len(unique_indices), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(save_figure, unique_indices))
+        else:
+            for index in unique_indices:
+                save_figure(index)
+
+        # Repeated figures get their own stream over the already rendered image data
+        for index, fig in enumerate(figures):
+            source_index = first_index[id(fig)]
+            if source_index != index:
+                buffers[index] = io.BytesIO(buffers[source_index].getvalue())
+
+        # Create content functions from the rendered figures, keeping the figure order
+        content_funcs = []
+        for buffer in buffers:
             # Create a closure with an explicit parameter to avoid loop variable capture issues
-            def create_content_func(image_path):
+            def create_content_func(image_stream):
                 def add_image_func(**kwargs):
                     return parent.add_image(
-                        image_path=image_path,
+                        image_path=image_stream,
                         x=kwargs.get("x", "10%"),
                         y=kwargs.get("y", "10%"),
                         width=kwargs.get("width", "80%"),
@@ -1267,40 +1469,76 @@ class Grid:
 
                 return add_image_func
 
-            # Add the content function to the list with temp_path bound to a parameter
-            content_funcs.append(create_content_func(image_path=temp_path))
+            # Add the content function to the list with the buffer bound to a parameter
+            content_funcs.append(create_content_func(image_stream=buffer))
 
         # Create the grid
-        try:
-            grid = cls.autogrid(
-                parent=parent,
-                content_funcs=content_funcs,
-                rows=rows,
-                cols=cols,
-                x=x,
-                y=y,
-                width=width,
-                height=height,
-                padding=padding,
-                title=title,
-                title_height=title_height,
-                title_align=title_align,
-                column_major=column_major,
-            )
-        finally:
-            # Clean up temporary files
-            for temp_file_path in temp_files:
-                try:
-                    if os.path.exists(temp_file_path):
-                        os.unlink(temp_file_path)
-                except OSError as e:
-                    import logging
-
-                    logging.warning(f"Failed to remove temporary file {temp_file_path}: {e}")
+        grid = cls.autogrid(
+            parent=parent,
+            content_funcs=content_funcs,
+            rows=rows,
+            cols=cols,
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+            padding=padding,
+            title=title,
+            title_height=title_height,
+            title_align=title_align,
+            column_major=column_major,
+        )
 
         return grid
 
 
+class GridRowView:
+    """Read-only view of one row of a Grid, as returned by Grid.cells.
+
+    Cells are fetched through Grid.get_cell when accessed, so viewing a row
+    does not build every GridCell in it.
+
+    Attributes:
+        grid: The Grid object the row belongs to
+        row: The row index
+    """
+
+    def __init__(self, grid: Grid, row: int):
+        """Initialize a row view.
+
+        Args:
+            grid: The Grid object the row belongs to
+            row: The row index
+        """
+        self.grid = grid
+        self.row = row
+
+    def __len__(self) -> int:
+        """Return the number of cells in the row."""
+        return self.grid.cols
+
+    def __getitem__(self, col: int) -> GridCell:
+        """Get the cell at the given column, supporting negative indices.
+
+        Args:
+            col: Column index
+
+        Returns:
+            The GridCell at this row and column
+
+        Raises:
+            OutOfBoundsError: If the column is out of bounds
+        """
+        if col < 0:
+            col += self.grid.cols
+        return self.grid.get_cell(self.row, col)
+
+    def __iter__(self):
+        """Iterate over the cells in the row."""
+        for col in range(self.grid.cols):
+            yield self.grid.get_cell(self.row, col)
+
+
 class GridFlatIterator:
     """Flat iterator for a Grid, like matplotlib's subplot.flat.
 
@@ -1343,4 +1581,4 @@ class GridFlatIterator:
         col = self.current_index % self.grid.cols
         self.current_index += 1
 
-        return self.grid.cells[row][col]
+        return self.grid.get_cell(row, col)
@@ -1,6 +1,6 @@
 """Slide module for EasyPPTX."""
 
-from typing import Any
+from typing import IO, Any
 
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
@@ -381,7 +381,7 @@ class Slide:
 
     def add_image(
         self,
-        image_path: str,
+        image_path: str | IO[bytes],
         x: PositionType = 1.0,
         y: PositionType = 1.0,
         width: PositionType | None = None,
@@ -391,7 +391,7 @@ class Slide:
         """Add an image to the slide.
 
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or a binary file-like object with the image data
             x: X position in inches or percentage (default: 1.0)
             y: Y position in inches or percentage (default: 1.0)
             width: Width in inches or percentage (default: None, maintains aspect ratio)
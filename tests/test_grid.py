@@ -2,9 +2,10 @@
 
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
-from easypptx.grid import Grid, GridCell
+from easypptx.grid import Grid, GridCell, _absolute_geometry, _grid_geometry, _parse_pct, _scan_and_mark
 
 
 class TestGrid:
@@ -79,6 +80,17 @@ class TestGrid:
         assert float(cell.width.strip("%")) > 40  # Width accounting for padding
         assert float(cell.height.strip("%")) > 40  # Height accounting for padding
 
+    def test_grid_geometry_is_cached(self):
+        """Test that grids with the same layout reuse the cached geometry."""
+        _grid_geometry.cache_clear()
+
+        first = Grid(parent=self.parent, rows=3, cols=4, padding=7.5)
+        second = Grid(parent=self.parent, x="50%", rows=3, cols=4, padding=7.5)
+
+        assert _grid_geometry.cache_info().hits == 1
+        assert [cell.x for cell in first] == [cell.x for cell in second]
+        assert first.cells[2][3].y == second.cells[2][3].y
+
     def test_get_cell(self):
         """Test retrieving a cell from the grid."""
         grid = Grid(parent=self.parent, rows=3, cols=3)
@@ -157,6 +169,35 @@ class TestGrid:
         with pytest.raises(ValueError):
             grid.add_to_cell(1, 0, content_func)  # Cell is spanned
 
+    def test_add_to_cells_bulk(self):
+        """Test adding content to several cells at once."""
+        grid = Grid(parent=self.parent, rows=2, cols=2)
+        grid.merge_cells(1, 0, 1, 1)
+
+        bulk_funcs = [MagicMock(return_value=f"content {i}") for i in range(3)]
+        results = grid.add_to_cells_bulk([
+            (0, 0, bulk_funcs[0], {"text": "a"}),
+            (0, 1, bulk_funcs[1], {}),
+            (1, 0, bulk_funcs[2], {}),
+        ])
+
+        assert results == ["content 0", "content 1", "content 2"]
+        assert bulk_funcs[0].call_args[1]["text"] == "a"
+        assert grid.get_cell(1, 0).content == "content 2"
+
+        # Positions match those computed by add_to_cell, including merged cells
+        reference = Grid(parent=self.parent, rows=2, cols=2)
+        reference.merge_cells(1, 0, 1, 1)
+        for (row, col), bulk_func in zip([(0, 0), (0, 1), (1, 0)], bulk_funcs, strict=True):
+            single_func = MagicMock()
+            reference.add_to_cell(row, col, single_func)
+            for key in ("x", "y", "width", "height"):
+                assert bulk_func.call_args[1][key] == single_func.call_args[1][key]
+
+        # Spanned cells are rejected
+        with pytest.raises(ValueError):
+            grid.add_to_cells_bulk([(1, 1, MagicMock(), {})])
+
     def test_add_grid_to_cell(self):
         """Test adding a nested grid to a cell."""
         grid = Grid(parent=self.parent, rows=2, cols=2)
@@ -185,6 +226,209 @@ class TestGrid:
         with pytest.raises(ValueError):
             grid.add_grid_to_cell(1, 1, rows=2, cols=2)  # Cell is spanned
 
+    def test_cell_to_absolute(self):
+        """Test that cell and nested grid positions are relative to the slide."""
+        grid = Grid(parent=self.parent, x="10%", y="20%", width="80%", height="60%", rows=2, cols=2, padding=0.0)
+
+        content_func = MagicMock()
+        grid.add_to_cell(1, 1, content_func)
+        call_kwargs = content_func.call_args[1]
+        assert call_kwargs["x"] == "50.00%"
+        assert call_kwargs["y"] == "50.00%"
+        assert call_kwargs["width"] == "40.00%"
+        assert call_kwargs["height"] == "30.00%"
+
+        nested_grid = grid.add_grid_to_cell(0, 1)
+        assert (nested_grid.x, nested_grid.y, nested_grid.width, nested_grid.height) == (
+            "50.00%",
+            "20.00%",
+            "40.00%",
+            "30.00%",
+        )
+
+    def test_absolute_geometry_is_cached(self):
+        """Test that repeated grid layouts reuse the cached slide positions."""
+        _absolute_geometry.cache_clear()
+
+        first = Grid(parent=self.parent, x="5%", y="10%", width="90%", height="80%", rows=2, cols=3)
+        second = Grid(parent=self.parent, x="5%", y="10%", width="90%", height="80%", rows=2, cols=3)
+        first_func = MagicMock()
+        second_func = MagicMock()
+        first.add_to_cell(1, 2, first_func)
+        second.add_to_cell(1, 2, second_func)
+
+        assert _absolute_geometry.cache_info().hits == 1
+        assert first_func.call_args == second_func.call_args
+
+        # The cached values match the direct calculation used for merged cells
+        cell = first.get_cell(1, 2)
+        expected = (
+            f"{5 + cell.x_pct * 0.9:.2f}%",
+            f"{10 + cell.y_pct * 0.8:.2f}%",
+            f"{cell.width_pct * 0.9:.2f}%",
+            f"{cell.height_pct * 0.8:.2f}%",
+        )
+        call_kwargs = first_func.call_args[1]
+        assert (call_kwargs["x"], call_kwargs["y"], call_kwargs["width"], call_kwargs["height"]) == expected
+
+    def test_cell_to_absolute_uses_unrounded_cell_geometry(self):
+        """Test that placements are computed from the exact cell geometry, not the rounded strings."""
+        grid = Grid(parent=self.parent, x="0%", width="87.3%", rows=1, cols=3, padding=5.0)
+
+        # The cell strings are rounded for display only
+        cell = grid.get_cell(0, 0)
+        assert (cell.x, cell.width) == ("0.83%", "31.67%")
+        assert cell.x_pct == pytest.approx(5 / 6)
+        assert cell.width_pct == pytest.approx(95 / 3)
+
+        # Parsing the rounded strings would give "0.72%" and "27.65%"
+        content_func = MagicMock()
+        grid.add_to_cell(0, 0, content_func)
+        call_kwargs = content_func.call_args[1]
+        assert call_kwargs["x"] == "0.73%"
+        assert call_kwargs["width"] == "27.64%"
+
+    def test_cell_to_absolute_respects_changed_cell_geometry(self):
+        """Test that changing a cell's numeric geometry moves its content."""
+        grid = Grid(parent=self.parent, x="10%", y="0%", width="80%", height="100%", rows=2, cols=2)
+        cell = grid.get_cell(0, 0)
+        cell.x_pct = 50.0
+        cell.width_pct = 25.0
+
+        content_func = MagicMock()
+        grid.add_to_cell(0, 0, content_func)
+        call_kwargs = content_func.call_args[1]
+        assert call_kwargs["x"] == "50.00%"
+        assert call_kwargs["width"] == "20.00%"
+
+        # Untouched cells still use the cached layout table
+        other_func = MagicMock()
+        grid.add_to_cell(1, 1, other_func)
+        assert other_func.call_args[1]["x"] == f"{10 + grid.get_cell(1, 1).x_pct * 0.8:.2f}%"
+
+    def test_cell_to_absolute_with_inches(self):
+        """Test that absolute grid positions and sizes are converted using the slide size."""
+        self.parent._slide_width = 9144000  # 10 inches
+        self.parent._slide_height = 6858000  # 7.5 inches
+        grid = Grid(parent=self.parent, x=1.0, y=0.75, width=5.0, height=3.75, rows=1, cols=1, padding=0.0)
+
+        content_func = MagicMock()
+        grid.add_to_cell(0, 0, content_func)
+        call_kwargs = content_func.call_args[1]
+        assert call_kwargs["x"] == "10.00%"
+        assert call_kwargs["y"] == "10.00%"
+        assert call_kwargs["width"] == "50.00%"
+        assert call_kwargs["height"] == "50.00%"
+
+    def test_cells_are_shared_between_accessors(self):
+        """Test that cells, get_cell and iteration return the same GridCell objects."""
+        grid = Grid(parent=self.parent, rows=2, cols=3)
+
+        assert grid.cells[1][2] is grid.get_cell(1, 2)
+        assert list(grid) == [cell for row in grid.cells for cell in row]
+
+        grid.merge_cells(0, 1, 1, 2)
+        assert grid.get_cell(1, 2).is_spanned
+        assert not grid.get_cell(0, 1).is_spanned
+        assert grid.get_cell(0, 1).span_cols == 2
+
+    def test_cells_are_built_on_demand(self):
+        """Test that GridCell objects are only created for accessed cells."""
+        grid = Grid(parent=self.parent, rows=10, cols=10)
+        assert len(grid._cell_cache) == 0
+
+        grid.add_to_cell(2, 3, MagicMock(return_value="content"))
+        assert list(grid._cell_cache) == [(2, 3)]
+        assert grid.get_cell(2, 3).content == "content"
+
+        # Cells built after a merge reflect the merged state
+        merged_cell = grid.merge_cells(4, 4, 5, 6)
+        assert grid.get_cell(5, 6).is_spanned
+        assert grid.get_cell(4, 4) is merged_cell
+        assert merged_cell.span_rows == 2
+        assert merged_cell.span_cols == 3
+
+    def test_cells_rows_are_lazy_views(self):
+        """Test that indexing grid.cells only builds the accessed cell."""
+        grid = Grid(parent=self.parent, rows=10, cols=10)
+
+        cell = grid.cells[3][-1]
+        assert (cell.row, cell.col) == (3, 9)
+        assert list(grid._cell_cache) == [(3, 9)]
+        assert len(grid.cells) == 10
+        assert len(grid.cells[0]) == 10
+
+        with pytest.raises(IndexError):
+            grid.cells[0][10]
+
+    def test_append_expands_grid(self):
+        """Test that append fills cells in order and adds a row when full."""
+        grid = Grid(parent=self.parent, rows=1, cols=2)
+
+        grid.append(lambda **kwargs: "first")
+        grid.append(lambda **kwargs: "second")
+        grid.append(lambda **kwargs: "third")
+
+        assert grid.rows == 2
+        assert [cell.content for cell in grid] == ["first", "second", "third", None]
+
+    def test_autogrid_title_offsets(self):
+        """Test that autogrid moves the grid below the title."""
+        content_func = MagicMock(return_value="content")
+
+        grid = Grid.autogrid(self.parent, [content_func], y="5%", height="90%", title="Title", title_height="12.5%")
+        assert grid.y == "17.50%"
+        assert grid.height == "77.50%"
+        assert self.parent.add_text.call_args[1]["y"] == "5%"
+
+        # Absolute positions are left as they are
+        self.parent._slide_width = 9144000
+        self.parent._slide_height = 6858000
+        grid = Grid.autogrid(self.parent, [content_func], y=1.0, height=5.0, title="Title")
+        assert grid.y == 1.0
+        assert grid.height == 5.0
+
+    def test_autogrid_calls_each_content_func(self):
+        """Test that autogrid calls every content function once, without position arguments."""
+        content_funcs = [MagicMock(return_value=f"content {i}") for i in range(4)]
+
+        grid = Grid.autogrid(self.parent, content_funcs, rows=2, cols=2)
+
+        for content_func in content_funcs:
+            content_func.assert_called_once_with()
+        # Cells are filled in column-major order
+        assert [cell.content for cell in grid] == ["content 0", "content 2", "content 1", "content 3"]
+
+    def test_autogrid_dimensions(self):
+        """Test the automatic grid dimensions for different item counts."""
+        for num_items, expected in [(1, (1, 1)), (3, (3, 1)), (4, (2, 2)), (5, (3, 2)), (10, (4, 3)), (16, (4, 4))]:
+            content_funcs = [MagicMock() for _ in range(num_items)]
+            grid = Grid.autogrid(self.parent, content_funcs)
+            assert (grid.rows, grid.cols) == expected
+
+    def test_parse_pct(self):
+        """Test parsing of percentage strings."""
+        assert _parse_pct("12.34%") == 12.34
+        assert _parse_pct("0%") == 0.0
+        assert _parse_pct("7.5") == 7.5
+
+    def test_scan_and_mark(self):
+        """Test the merge region scan on the spanned-flag array."""
+        spanned = np.zeros((3, 3), dtype=bool)
+
+        # A free region is marked, except for its top-left cell
+        assert not _scan_and_mark(spanned, 0, 0, 1, 1)
+        assert spanned.tolist() == [
+            [False, True, False],
+            [True, True, False],
+            [False, False, False],
+        ]
+
+        # An overlapping region is rejected and left untouched
+        before = spanned.copy()
+        assert _scan_and_mark(spanned, 1, 1, 2, 2)
+        assert (spanned == before).all()
+
 
 class TestGridCell:
     """Test cases for the GridCell class."""
@@ -218,3 +462,26 @@ class TestGridCell:
         assert "y=20%" in repr_str
         assert "width=30%" in repr_str
         assert "height=40%" in repr_str
+
+    def test_grid_cell_numeric_fields(self):
+        """Test GridCell numeric percentage fields."""
+        cell = GridCell(row=0, col=0, x="10%", y="20%", width="30%", height="40%")
+
+        # Numeric fields are parsed from the strings when not given
+        assert cell.x_pct == 10.0
+        assert cell.y_pct == 20.0
+        assert cell.width_pct == 30.0
+        assert cell.height_pct == 40.0
+
+        # Explicit numeric values take precedence
+        cell = GridCell(row=0, col=0, x="10.00%", y="0%", width="0%", height="0%", x_pct=10.004)
+        assert cell.x_pct == 10.004
+
+    def test_merged_cell_numeric_fields(self):
+        """Test that merging updates the numeric width and height."""
+        grid = Grid(parent=MagicMock(), rows=2, cols=2, padding=0.0)
+        merged_cell = grid.merge_cells(0, 0, 1, 1)
+
+        assert merged_cell.width_pct == pytest.approx(100.0)
+        assert merged_cell.height_pct == pytest.approx(100.0)
+        assert merged_cell.width == "100.00%"
@@ -123,3 +123,68 @@ class TestGridEnhancedMethods:
             # Verify that the result is correct
             assert result == "table_shape"
             assert self.grid.cells[0][0].content == "table_shape"
+
+    def test_autogrid_pyplot_uses_in_memory_buffers(self):
+        """Test that autogrid_pyplot renders figures without temporary files."""
+        import io
+
+        figures = [MagicMock(), MagicMock()]
+
+        with unittest.mock.patch("tempfile.NamedTemporaryFile", side_effect=AssertionError("no temp files")):
+            grid = Grid.autogrid_pyplot(self.parent, figures, rows=1, cols=2, dpi=100)
+
+        for figure in figures:
+            figure.savefig.assert_called_once()
+            assert isinstance(figure.savefig.call_args[0][0], io.BytesIO)
+            assert figure.savefig.call_args[1]["dpi"] == 100
+
+        # Each figure buffer is passed to add_image in order
+        streams = [call[1]["image_path"] for call in self.parent.add_image.call_args_list]
+        assert streams == [figure.savefig.call_args[0][0] for figure in figures]
+        assert [cell.content for cell in grid] == ["image_shape", "image_shape"]
+
+    def test_autogrid_pyplot_parallel_preserves_order(self):
+        """Test that figures rendered in parallel or sequentially keep their grid order."""
+        for parallel in (True, False):
+            parent = MagicMock()
+            parent.add_image = MagicMock(side_effect=lambda **kwargs: kwargs["image_path"].getvalue())
+
+            figures = []
+            for index in range(5):
+                figure = MagicMock()
+                figure.savefig = MagicMock(side_effect=lambda buffer, i=index, **kwargs: buffer.write(b"figure-%d" % i))
+                figures.append(figure)
+
+            grid = Grid.autogrid_pyplot(parent, figures, rows=5, cols=1, parallel=parallel)
+
+            assert [cell.content for cell in grid] == [b"figure-%d" % i for i in range(5)]
+
+    def test_autogrid_pyplot_renders_repeated_figures_once(self):
+        """Test that a figure listed more than once is saved a single time."""
+        figure = MagicMock()
+        figure.savefig = MagicMock(side_effect=lambda buffer, **kwargs: buffer.write(b"figure"))
+        other = MagicMock()
+        other.savefig = MagicMock(side_effect=lambda buffer, **kwargs: buffer.write(b"other"))
+        self.parent.add_image = MagicMock(side_effect=lambda **kwargs: kwargs["image_path"])
+
+        grid = Grid.autogrid_pyplot(self.parent, [figure, other, figure], rows=3, cols=1, parallel=True)
+
+        figure.savefig.assert_called_once()
+        other.savefig.assert_called_once()
+        streams = [cell.content for cell in grid]
+        assert [stream.getvalue() for stream in streams] == [b"figure", b"other", b"figure"]
+        # Each cell gets its own stream so python-pptx can read them independently
+        assert streams[0] is not streams[2]
+
+    def test_autogrid_pyplot_accepts_iterables(self):
+        """Test that figures can be passed as any iterable, such as a generator."""
+        figures = []
+        for index in range(3):
+            figure = MagicMock()
+            figure.savefig = MagicMock(side_effect=lambda buffer, i=index, **kwargs: buffer.write(b"figure-%d" % i))
+            figures.append(figure)
+        self.parent.add_image = MagicMock(side_effect=lambda **kwargs: kwargs["image_path"].getvalue())
+
+        grid = Grid.autogrid_pyplot(self.parent, (figure for figure in figures), rows=3, cols=1)
+
+        assert [cell.content for cell in grid] == [b"figure-0", b"figure-1", b"figure-2"]